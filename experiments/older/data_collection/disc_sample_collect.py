@@ -36,7 +36,7 @@ def sample_uniform_disc(radius=1):
 
 voter_params = {'radius': 1}
 candidate_params = {'radius': 1}
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 disc_generator = Spatial(m = m,
                     voter_dist = sample_uniform_disc, voter_params = voter_params,
@@ -35,7 +35,7 @@ for i,std in enumerate(stds):
     
 candidate_params = {'low': -5, 'high': 5, 'size': 2}
 
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 four_party_generator = GroupSpatial(m = m, g = len(four_party_G),
                     voter_dists = [np.random.normal]*len(four_party_G), voter_params = voter_params,
@@ -35,7 +35,7 @@ for i,std in enumerate(stds):
     voter_params[i]['scale'] = std
 
 # define a distance function between voters and candidates
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 # Create the group spatial generator object!
 four_party_generator = GroupSpatial(m = m, g = len(four_party_G),
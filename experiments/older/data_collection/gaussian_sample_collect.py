@@ -26,7 +26,7 @@ voter_params = {'loc': [0,0], 'scale': 1, 'size': 2}
 candidate_params = {'loc': [0,0], 'scale': 1, 'size': 2}
 
 # define a distance function between voters and candidates
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 # Create the group spatial generator object!
 gaussian_generator = Spatial(m = m, voter_dist = np.random.normal, voter_params = voter_params,
@@ -26,7 +26,7 @@ voter_params = {'low': 0, 'high': 1, 'size': 2}
 candidate_params = {'low': 0, 'high': 1, 'size': 2}
 
 # define a distance function between voters and candidates
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 # Create the group spatial generator object!
 square_generator = Spatial(m = m, voter_dist = np.random.uniform, voter_params = voter_params,
@@ -26,7 +26,7 @@ for i,std in enumerate(stds):
     
 candidate_params = [{'low': -8, 'high': 8, 'size': 2}]
 
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 two_party_generator = GroupSpatial(
     n_voter_groups = 2,
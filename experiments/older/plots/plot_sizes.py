@@ -6,27 +6,15 @@ import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes, mark_inset
 import seaborn as sns
+from concurrent.futures import ThreadPoolExecutor
+from metric_voting import *
 
 
-#sys.path.append(os.path.join(os.getcwd(), 'metric_voting/code'))
-sys.path.append('../../code')
-from elections import SNTV,Bloc,STV,Borda, ChamberlinCourant, Monroe, GreedyCC, PluralityVeto, SMRD, OMRD, DMRD, ExpandingApprovals
-from tools import group_representation, max_group_representation
-
-
-# Specify results to plot from:
-input_file = '../../data/2bloc.npz'
-
-# And where to save them!
+# Where to save results!
 output_file1 = '../../figures/2bloc_sizes.png'
 output_file2 = '../../figures/2bloc_sizes_overall.png'
 
 
-# Read data
-loaded_data = np.load(input_file)
-result_dict = {key: loaded_data[key] for key in loaded_data.files}
-
-
 # Specify elections used (and number of samples for each)
 elections_list = [SNTV, Bloc, STV, Borda, ChamberlinCourant, GreedyCC, Monroe, PluralityVeto, ExpandingApprovals, SMRD, OMRD, DMRD]
 n_samples = 1000
@@ -52,50 +40,164 @@ plt.rcParams.update({
     "font.size": 24
 })
 
+####################################################################################################################################
+# Batched measurements over the sample axis
+
+def batch_cost_array(voters, candidates, dtype = np.float32):
+    """
+    Stacks the (m x n) euclidean cost array of every sample into 
+    a single (samples x m x n) array. Single precision is enough for 
+    these ratios of summed distances, and halves the memory of the stack.
+    """
+    n_batch, n, _ = voters.shape
+    m = candidates.shape[1]
+    cst = np.empty((n_batch, m, n), dtype = dtype)
+    for i in range(n_batch):
+        cst[i] = euclidean_cost_array(voters[i], candidates[i])
+    return cst
+
+
+def batch_candidate_costs(cst, bloc_masks):
+    """
+    candidate_costs() of each sample's bloc, where bloc_masks 
+    is a (samples x n) boolean array marking the voters in each sample's bloc.
+    """
+    return (cst @ bloc_masks[:, :, np.newaxis].astype(cst.dtype))[:, :, 0]
+
+
+def batch_min_assignment_cost(candidate_csts, sizes):
+    """
+    min_assignment_cost() for every sample at once, given each sample's 
+    candidate costs and the number of representatives its bloc deserves.
+    """
+    n_batch, m = candidate_csts.shape
+    
+    # Cost of the best size candidates is read off of the cumulative sums.
+    cumulative_csts = np.zeros((n_batch, m + 1))
+    cumulative_csts[:, 1:] = np.cumsum(np.sort(candidate_csts, axis = 1), axis = 1)
+    return cumulative_csts[np.arange(n_batch), sizes]
+
+
+def batch_group_inefficiency(candidate_csts, winner_masks, sizes, cost2):
+    """
+    group_inefficiency() for every sample at once, where winner_masks is a 
+    (samples x m) boolean array marking each sample's k winners. Winner costs are 
+    read from the same candidate costs as the best subsets, so that both agree exactly 
+    when the winners are the best candidates. The cost of the best candidate subsets, 
+    cost2, does not depend on the winners, so it is computed once with 
+    batch_min_assignment_cost() and shared between elections.
+    """
+    n_batch = candidate_csts.shape[0]
+    k = np.sum(winner_masks[0])
+    winner_csts = candidate_csts[winner_masks].reshape(n_batch, k)
+    cost1 = batch_min_assignment_cost(winner_csts, sizes)
+    
+    ratios = np.ones(n_batch)
+    nonzero = (cost1 != 0) | (cost2 != 0)
+    ratios[nonzero] = cost1[nonzero] / cost2[nonzero]
+    return ratios
+
+
+def load_samples(f, keys):
+    """
+    Reads only the requested arrays from a sample file into memory. 
+    Arrays in an .npz file are decompressed on access, so the rest are never read.
+    """
+    with np.load(f) as loaded_data:
+        return {key: loaded_data[key] for key in keys}
+
+
 ####################################################################################################################################
 # Compute results
 
-group_sizes = [[100 - i, i] for i in range(0, 105, 5)]
+group_sizes = np.array([[100 - i, i] for i in range(0, 105, 5)])
 group_select = 1
 num_sizes = len(group_sizes)
 
-size_avg_represent = {e.__name__:(np.zeros(num_sizes), np.zeros(num_sizes)) for e in elections_list}
-size_avg_represent_overall = {e.__name__:(np.zeros(num_sizes), np.zeros(num_sizes)) for e in elections_list}
+election_names = [e.__name__ for e in elections_list]
+represent_arr = np.zeros((num_sizes, len(elections_list), n_samples))
+represent_overall_arr = np.zeros_like(represent_arr)
 
-for s in range(num_sizes):
-    f = 'metric_voting/data/2sizes' + str(s) + '.npz'
-    loaded_data = np.load(f)
-    result_dict = {key: loaded_data[key] for key in loaded_data.files}
-    
-    s_avg_represent = {e.__name__:np.zeros(n_samples) for e in elections_list}
-    s_avg_represent_overall = {e.__name__:np.zeros(n_samples) for e in elections_list}
+files = ['metric_voting/data/2sizes' + str(s) + '.npz' for s in range(num_sizes)]
+keys = ['voters', 'candidates', 'voter_labels'] + election_names
+
+# Read every size file (two at a time), then stack each array as (sizes x samples x ...).
+with ThreadPoolExecutor(max_workers = 2) as executor:
+    loaded_list = list(executor.map(lambda f: load_samples(f, keys), files))
     
-    for i in range(n_samples):
-        voter_positions = result_dict['voters'][i]
-        candidate_positions = result_dict['candidates'][i]
-        labels = result_dict['labels'][i]
-        labels_overall = np.zeros(len(labels))
-
-        for j,E in enumerate(elections_list):
-            name = E.__name__
-                
-            winners = result_dict[name][i]
-            represent = group_representation(voter_positions, candidate_positions, labels, winners, group_select, size = None)
-            represent_overall = group_representation(voter_positions, candidate_positions, labels_overall, winners, 0, size = None)
-            s_avg_represent[name][i] = represent
-            s_avg_represent_overall[name][i] = represent_overall
-            
-    for ename, evals in s_avg_represent.items():
-        # BUG fix for now:
-        eval_data = evals[evals >= 1]
-        size_avg_represent[ename][0][s] = np.mean(eval_data)
-        size_avg_represent[ename][1][s] = np.std(eval_data)
-        
-    for ename, evals in s_avg_represent_overall.items():
-        # BUG fix for now:
-        eval_data = evals[evals >= 1]
-        size_avg_represent_overall[ename][0][s] = np.mean(eval_data)
-        size_avg_represent_overall[ename][1][s] = np.std(eval_data)
+stacked_dict = {
+    key: np.stack([np.asarray(d[key][:n_samples]) for d in loaded_list]) for key in keys
+}
+del loaded_list
+
+# Flatten the size and sample axes into one batch of (sizes * samples) elections.
+_, _, n, d = stacked_dict['voters'].shape
+m = stacked_dict['candidates'].shape[2]
+voters = stacked_dict['voters'].reshape(-1, n, d)
+candidates = stacked_dict['candidates'].reshape(-1, m, d)
+labels = stacked_dict['voter_labels'].reshape(-1, n)
+
+cst = batch_cost_array(voters, candidates)
+masks = labels == group_select
+
+# Every election elects the same number of winners.
+k = np.sum(stacked_dict[election_names[0]][0, 0])
+sizes = (np.sum(masks, axis = 1) / n * k).astype(int)
+sizes_overall = np.full(len(labels), k)
+
+candidate_csts = batch_candidate_costs(cst, masks)
+# The overall bloc is every voter, so no mask is needed.
+candidate_csts_overall = np.sum(cst, axis = 2)
+best_cost = batch_min_assignment_cost(candidate_csts, sizes)
+best_cost_overall = batch_min_assignment_cost(candidate_csts_overall, sizes_overall)
+
+# Check on a few samples that single precision costs don't change the scores.
+check_csts = np.sum(
+    batch_cost_array(voters[:10], candidates[:10], dtype = np.float64),
+    axis = 2
+)
+check_winners = stacked_dict[election_names[0]].reshape(-1, m)[:10]
+assert np.allclose(
+    batch_group_inefficiency(
+        candidate_csts_overall[:10], 
+        check_winners, 
+        sizes_overall[:10], 
+        best_cost_overall[:10]
+    ),
+    batch_group_inefficiency(
+        check_csts, 
+        check_winners, 
+        sizes_overall[:10], 
+        batch_min_assignment_cost(check_csts, sizes_overall[:10])
+    ),
+    rtol = 1e-4
+)
+
+for j,name in enumerate(election_names):
+    winners = stacked_dict[name].reshape(-1, m)
+    represent_arr[:, j, :] = batch_group_inefficiency(
+        candidate_csts, winners, sizes, best_cost
+    ).reshape(num_sizes, n_samples)
+    represent_overall_arr[:, j, :] = batch_group_inefficiency(
+        candidate_csts_overall, winners, sizes_overall, best_cost_overall
+    ).reshape(num_sizes, n_samples)
+
+# BUG fix for now: 
+represent_arr[represent_arr < 1] = np.nan
+represent_overall_arr[represent_overall_arr < 1] = np.nan
+
+represent_mean = np.nanmean(represent_arr, axis = 2)
+represent_std = np.nanstd(represent_arr, axis = 2)
+represent_overall_mean = np.nanmean(represent_overall_arr, axis = 2)
+represent_overall_std = np.nanstd(represent_overall_arr, axis = 2)
+
+size_avg_represent = {
+    name:(represent_mean[:, j], represent_std[:, j]) for j,name in enumerate(election_names)
+}
+size_avg_represent_overall = {
+    name:(represent_overall_mean[:, j], represent_overall_std[:, j]) 
+    for j,name in enumerate(election_names)
+}
         
 ##############################################################################################################
 # Plot results
@@ -107,7 +209,7 @@ fig,ax = plt.subplots(figsize=(10, 6), dpi = 200)
 # Create the inset of the zoomed area
 #axins = inset_axes(ax, width="30%", height="30%", loc='lower right')  # Set the location
 
-Asizes = [x[group_select]/100 for x in group_sizes]
+Asizes = group_sizes[:, group_select] / 100
 for i, (ename,evals) in enumerate(size_avg_represent.items()):
     if name == 'ChamberlinCourant':
         name_label = 'CC'
@@ -153,7 +255,7 @@ plt.show()
 
 fig,ax = plt.subplots(figsize=(10, 7), dpi = 200)
 
-Asizes = [x[group_select]/100 for x in group_sizes]
+Asizes = group_sizes[:, group_select] / 100
 for i, (ename,evals) in enumerate(size_avg_represent_overall.items()):
     if name == 'ChamberlinCourant':
         name_label = 'CC'
@@ -30,7 +30,7 @@ for i,std in enumerate(stds):
 candidate_params = [{'low': -2, 'high': 2, 'size': 2}]
 
 # define a distance function between voters and candidates
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 # Create the group spatial generator object!
 generator = GroupSpatial(n_voter_groups = 2, n_candidate_groups = 1,
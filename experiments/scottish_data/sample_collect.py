@@ -24,7 +24,7 @@ candidate_positions[4, :3] = [0.42, -0.41, -0.32]
 
 voter_dist_fn = np.random.uniform
 voter_dist_fn_params = {'low' : -2, 'high' : 2, 'size' : d}
-distance = lambda point1, point2: np.linalg.norm(point1 - point2)
+distance = 'euclidean'
 
 ranked_generator = RankedSpatial(
     voter_dist_fn,
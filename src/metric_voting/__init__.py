@@ -40,7 +40,9 @@ from .measurements import (
     proportional_assignment,
     proportional_assignment_cost,
     group_inefficiency,
+    greedy_bloc_weights,
     random_group_inefficiency,
+    random_group_inefficiency_batch,
     worst_random_group_inefficiency,
     q_costs, 
     q_cost_array,
@@ -49,8 +51,11 @@ from .measurements import (
 
 from .utils import (
     euclidean_distance,
+    manhattan_distance,
+    chebyshev_distance,
     cost_array_to_ranking,
     tiebreak,
+    tiebreak_smallest,
     borda_matrix,
     remove_candidates,
     uniform_profile,
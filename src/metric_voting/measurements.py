@@ -1,31 +1,61 @@
 import numpy as np
 import math
 from itertools import combinations
+from scipy.spatial.distance import cdist
 from numpy.typing import NDArray
 from typing import Callable, Tuple, Any, Optional, Union, List, Set
-from .utils import euclidean_distance, tiebreak, random_voter_bloc
-
+from .utils import (
+    euclidean_distance,
+    manhattan_distance,
+    chebyshev_distance,
+    tiebreak,
+    tiebreak_smallest,
+    random_voter_bloc,
+)
+
+
+# Distance functions from utils with an equivalent compiled metric in cdist().
+_CDIST_METRICS = {
+    euclidean_distance: 'euclidean',
+    manhattan_distance: 'cityblock',
+    chebyshev_distance: 'chebyshev',
+}
+
+# Dimension at which euclidean_cost_array() switches from cdist() to the 
+# matrix product expansion of squared distances.
+_GEMM_MIN_DIM = 64
 
 def cost_array(
         voter_positions: NDArray, 
         candidate_positions: NDArray, 
-        distance_fn: Callable = euclidean_distance
+        distance_fn: Union[Callable, str] = euclidean_distance
 ) -> NDArray:
     """
     Given a set of voter and candidate positions along with a distance function,
     returns an (m x n) array with each entry i,j storing the
     distance from candidate i to voter j.
 
+    NOTE: The distance functions provided in utils (euclidean, manhattan, chebyshev), 
+        or any metric given by name, are computed with scipy's cdist(). 
+        Other callables are evaluated pair by pair.
+
     Args:
         voter_positions (np.ndarray): (n x d) Array of voter positions in a metric space.
         candidate_positions (np.ndarray): (m x d) Array of candidate positions in a metric space.
-        distance_fn (callable, optional): Callable distance function which should
+        distance_fn (callable OR str, optional): Callable distance function which should
             take as input two d dimensional vectors and output a real number,
             defaults to euclidean_distance (see euclidean_distance() above for a reference format).
+            May also be the name of any metric supported by scipy.spatial.distance.cdist(), 
+            for example 'cityblock' or 'cosine'.
 
     Returns:
         (np.ndarray): Size (m x n) array of distances from voters to candidates.
     """
+    if not isinstance(distance_fn, str):
+        distance_fn = _CDIST_METRICS.get(distance_fn, distance_fn)
+
+    if isinstance(distance_fn, str):
+        return cdist(candidate_positions, voter_positions, metric=distance_fn)
 
     dists = np.zeros((len(candidate_positions), len(voter_positions)))
     for i in range(len(candidate_positions)):
@@ -44,7 +74,12 @@ def euclidean_cost_array(
     distance from candidate i to voter j.
 
     NOTE: This is an optimized version of cost_array()
-        which assumes distance is euclidean.
+        which assumes distance is euclidean. Distances are computed 
+        directly by cdist(), so no (m x n x d) array of differences is formed.
+        For high dimensional positions (d >= _GEMM_MIN_DIM) squared distances are
+        instead expanded as ||c||^2 + ||v||^2 - 2 c.v, so that the bulk of the work 
+        is a single matrix product. This is faster, but slightly less precise 
+        for points which are very close together. 
 
     Args:
         voter_positions (np.ndarray): (n x d) Array of voter positions in a metric space.
@@ -53,9 +88,19 @@ def euclidean_cost_array(
     Returns:
         (np.ndarray): Size (m x n) array of distances from voters to candidates.
     """
-    diffs = voter_positions[np.newaxis, :, :] - candidate_positions[:, np.newaxis, :]
-    dists = np.sqrt(np.sum(diffs**2, axis=-1))
-    return dists
+    if candidate_positions.shape[1] < _GEMM_MIN_DIM:
+        return cdist(candidate_positions, voter_positions, metric='euclidean')
+
+    # Squared norms are broadcast as open (m x 1) and (1 x n) grids, and every
+    # step is done in place, so only the single (m x n) output is allocated.
+    voter_sq = np.einsum('ij,ij->i', voter_positions, voter_positions)
+    candidate_sq = np.einsum('ij,ij->i', candidate_positions, candidate_positions)
+    dists = (candidate_positions @ voter_positions.T).astype(float, copy = False)
+    dists *= -2
+    dists += candidate_sq[:, np.newaxis]
+    dists += voter_sq[np.newaxis, :]
+    np.maximum(dists, 0, out = dists)
+    return np.sqrt(dists, out = dists)
 
 
 def cost(cst_array: NDArray) -> float:
@@ -124,7 +169,7 @@ def q_costs(
     Returns:
         (np.ndarray): Size n array of distances from voters to candidates.
     """
-    return np.sort(cst_array, axis = 0)[q - 1, :]
+    return np.partition(cst_array, q - 1, axis = 0)[q - 1, :]
 
 
 def q_cost_array(
@@ -187,9 +232,10 @@ def min_assignment_cost(cst_array: NDArray, size: int) -> float:
     if size > len(cst_array):
         raise ValueError("Requested size is too large!")
 
+    # Ties don't change the cost, so only the selected costs need sorting. 
+    # Summing them in sorted order makes optimal subsets give equal costs.
     candidate_csts = candidate_costs(cst_array)
-    min_cands = tiebreak(candidate_csts)[:size]
-    return np.sum(candidate_csts[min_cands])
+    return np.sum(np.sort(np.partition(candidate_csts, size - 1)[:size]))
 
 
 def proportional_assignment(
@@ -249,6 +295,47 @@ def proportional_assignment_cost(
 
 
 
+def _group_inefficiency_core(
+    cst_array: NDArray, 
+    winner_indices: NDArray, 
+    bloc_mask: NDArray, 
+    size: int
+) -> float:
+    """
+    Computes the group inefficiency score for a bloc given as a boolean mask 
+    over voters, which is represented by a set of size candidates. 
+    The bloc's candidate costs are summed once, as a matrix-vector product 
+    with the mask, and shared by both the winner and the overall candidate subsets.
+
+    Args:
+        cst_array (np.ndarray): (m x n) Array of costs with 
+            each entry i,j computed as the distance from candidate i to voter j. 
+        winner_indices (np.ndarray[int]): Length k array of winning candidate indices.
+        bloc_mask (np.ndarray[bool]): Length n boolean array, True for voters in the bloc.
+            May be None when the bloc is every voter, in which case no mask is applied.
+        size (int): Number of representatives the bloc deserves.
+        
+    Returns:
+        float: Group inefficiency score.
+    """
+    # A bloc that deserves no representatives has zero cost for any subset.
+    if size == 0:
+        return 1
+    
+    if bloc_mask is None:
+        bloc_csts = candidate_costs(cst_array)
+    else:
+        bloc_csts = cst_array @ bloc_mask.astype(cst_array.dtype)
+    # Both subsets are summed in sorted order, so that optimal winners give a ratio of exactly 1.
+    cost1 = np.sum(np.sort(np.partition(bloc_csts[winner_indices], size - 1)[:size]))
+    cost2 = np.sum(np.sort(np.partition(bloc_csts, size - 1)[:size]))
+    
+    if cost1 == 0 and cost2 == 0:
+        return 1
+    
+    return cost1 / cost2
+
+
 def group_inefficiency(
     cst_array: NDArray, 
     winner_indices: NDArray, 
@@ -273,24 +360,57 @@ def group_inefficiency(
     Returns:
         float: Group inefficiency score.
     """
+    _, n = cst_array.shape
     k = len(winner_indices)
-    cost1 = proportional_assignment_cost(
-        cst_array[winner_indices, :],
-        voter_labels,
-        bloc_label,
-        k
-    )
-    cost2 = proportional_assignment_cost(
-        cst_array,
-        voter_labels,
-        bloc_label,
-        k
-    )
-    
-    if cost1 == 0 and cost2 == 0:
-        return 1
+    bloc_mask = voter_labels == bloc_label
+    bloc_size = np.sum(bloc_mask)
+    size = int(bloc_size / n * k)
+    if bloc_size == n:
+        bloc_mask = None
+    return _group_inefficiency_core(cst_array, winner_indices, bloc_mask, size)
+
+
+def greedy_bloc_weights(
+    cost_arr: NDArray, 
+    winner_indices: NDArray, 
+    t: Optional[int] = 1
+) -> NDArray:
+    """
+    Computes voter probabilities of selection into a random bloc with t representatives,
+    using a greedy heuristic: each voter is weighted by the ratio between the cost of their 
+    t closest winners and the cost of their t closest candidates. The weights only depend 
+    on the inputs, so they may be computed once and reused for many random blocs. 
     
-    return cost1 / cost2
+    Args:
+        cost_arr (np.ndarray): (m x n) Array of costs with 
+            each entry i,j computed as the distance from candidate i to voter j. 
+        winner_indices (np.ndarray[int]): Length k array of winning candidate indices.
+        t (int, optional): Number of representatives that the voter bloc 'deserves.'
+            Defaults to 1.
+            
+    Returns:
+        weights (np.ndarray): Length n array of voter probabilities of selection.
+    """
+    if t == 1:
+        # Only each voter's closest winner and candidate are needed.
+        winner_set_cost_arr = np.min(cost_arr[winner_indices, :], axis = 0)
+        candidate_set_cost_arr = np.min(cost_arr, axis = 0)
+        
+    else:
+        # Get cost to winners for all voters
+        winner_set_cost_arr = np.sum(
+            np.partition(cost_arr[winner_indices, :], t - 1, axis = 0)[:t, :], axis = 0
+        )
+
+        # Cost of best k candidates for each voter
+        candidate_set_cost_arr = np.sum(
+            np.partition(cost_arr, t - 1, axis = 0)[:t, :], axis = 0
+        )
+
+    # Greedy estimate / inefficiency heuristic for voters
+    greedy_scores = (winner_set_cost_arr / candidate_set_cost_arr)
+    greedy_scores = np.nan_to_num(greedy_scores, nan=0.0)
+    return greedy_scores / np.sum(greedy_scores)
 
 
 def random_group_inefficiency(
@@ -312,36 +432,98 @@ def random_group_inefficiency(
         t (int, optional): Number of representatives that the voter bloc 'deserves.'
             Defaults to 1.
         weights (np.ndarray, optional): Voter probabilities of selection. Defaults to None, 
-            in which case a greedy heuristic is used. 
+            in which case a greedy heuristic is used (see greedy_bloc_weights()). 
     """
     _, n = cost_arr.shape
     k = len(winner_indices)
     
     if weights is None:
-        # Get cost to winners for all voters
-        winner_set_cost_arr = np.sum(
-            np.sort(cost_arr[winner_indices, :], axis = 0)[:t, :], axis = 0
-        )
-
-        # Cost of best k candidates for each voter
-        candidate_set_cost_arr = np.sum(
-            np.sort(cost_arr, axis = 0)[:t, :], axis = 0
-        )
-
-        # Greedy estimate / inefficiency heuristic for voters
-        greedy_scores = (winner_set_cost_arr / candidate_set_cost_arr)
-        greedy_scores = np.nan_to_num(greedy_scores, nan=0.0)
-        weights = greedy_scores / np.sum(greedy_scores)
+        weights = greedy_bloc_weights(cost_arr, winner_indices, t)
     
     random_bloc = random_voter_bloc(n, k, t = t, weights = weights)
-    random_bloc_labels = np.zeros(n)
-    random_bloc_labels[random_bloc] = 1
+    size = int(len(random_bloc) / n * k)
+    if len(random_bloc) == n:
+        random_bloc_mask = None
+    else:
+        random_bloc_mask = np.zeros(n, dtype = bool)
+        random_bloc_mask[random_bloc] = True
     return (
-        group_inefficiency(cost_arr, winner_indices, random_bloc_labels, bloc_label=1), 
+        _group_inefficiency_core(cost_arr, winner_indices, random_bloc_mask, size), 
         random_bloc
     )
     
     
+def _smallest_cost_sums(csts: NDArray, sizes: NDArray) -> NDArray:
+    """
+    For each column j of an array of candidate costs, sums its sizes[j] smallest entries.
+    
+    Args:
+        csts (np.ndarray): (m x r) Array of candidate costs.
+        sizes (np.ndarray[int]): Length r array of subset sizes.
+        
+    Returns:
+        (np.ndarray): Length r array of sums.
+    """
+    max_size = np.max(sizes)
+    if max_size == 0:
+        return np.zeros(csts.shape[1])
+    
+    # Only the smallest max_size rows need to be in sorted order.
+    smallest = np.sort(np.partition(csts, max_size - 1, axis = 0)[:max_size, :], axis = 0)
+    cumulative_csts = np.zeros((max_size + 1, csts.shape[1]))
+    cumulative_csts[1:, :] = np.cumsum(smallest, axis = 0)
+    return cumulative_csts[sizes, np.arange(csts.shape[1])]
+
+
+def random_group_inefficiency_batch(
+    cost_arr: NDArray, 
+    winner_indices: NDArray, 
+    n_draws: int,
+    t: Optional[int] = 1,
+    weights : Optional[NDArray] = None
+) -> Tuple[NDArray, NDArray]:
+    """
+    Computes the group inefficiency scores of n_draws randomly selected blocs of voters 
+    with t representatives, as in random_group_inefficiency(). All blocs are reduced against 
+    the cost array at once, as a single product with the (n_draws x n) matrix of bloc masks.
+    
+    Args:
+        cost_arr (np.ndarray): (m x n) Array of costs with 
+            each entry i,j computed as the distance from candidate i to voter j. 
+        winner_indices (np.ndarray[int]): Length k array of winning candidate indices.
+        n_draws (int): Number of random blocs to draw.
+        t (int, optional): Number of representatives that the voter bloc 'deserves.'
+            Defaults to 1.
+        weights (np.ndarray, optional): Voter probabilities of selection. Defaults to None, 
+            in which case a greedy heuristic is used (see greedy_bloc_weights()). 
+            
+    Returns:
+        scores (np.ndarray): Length n_draws array of group inefficiency scores.
+        bloc_masks (np.ndarray[bool]): (n_draws x n) Array, with row r marking 
+            the voters in the r-th random bloc.
+    """
+    _, n = cost_arr.shape
+    k = len(winner_indices)
+    
+    if weights is None:
+        weights = greedy_bloc_weights(cost_arr, winner_indices, t)
+    
+    bloc_masks = np.zeros((n_draws, n), dtype = bool)
+    for r in range(n_draws):
+        bloc_masks[r, random_voter_bloc(n, k, t = t, weights = weights)] = True
+    sizes = (np.sum(bloc_masks, axis = 1) / n * k).astype(int)
+    
+    # (m x n_draws) candidate costs for every bloc.
+    bloc_csts = cost_arr @ bloc_masks.T.astype(cost_arr.dtype)
+    cost1 = _smallest_cost_sums(bloc_csts[winner_indices, :], sizes)
+    cost2 = _smallest_cost_sums(bloc_csts, sizes)
+    
+    scores = np.ones(n_draws)
+    nonzero = (cost1 != 0) | (cost2 != 0)
+    scores[nonzero] = cost1[nonzero] / cost2[nonzero]
+    return scores, bloc_masks
+
+
 def worst_random_group_inefficiency(
     n_samples : int,
     cost_arr: NDArray, 
@@ -363,13 +545,23 @@ def worst_random_group_inefficiency(
     worst_score = 0
     worst_bloc = None 
     
+    # Greedy weights only depend on t, so compute them once for each t.
+    t_weights = {}
+    
     for _ in range(n_samples):
         rand_t = np.random.randint(1, len(winner_indices) + 1)
+        if weights is not None:
+            rand_weights = weights
+        else:
+            if rand_t not in t_weights:
+                t_weights[rand_t] = greedy_bloc_weights(cost_arr, winner_indices, rand_t)
+            rand_weights = t_weights[rand_t]
+            
         score, bloc = random_group_inefficiency(
             cost_arr, 
             winner_indices, 
             t = rand_t, 
-            weights = weights
+            weights = rand_weights
         )
         if score > worst_score:
             worst_score = score
@@ -417,10 +609,18 @@ def heuristic_worst_bloc(
         
         for comb in combs:
             sum_of_distances = np.sum(cst_array[list(comb), :], axis = 0)
-            closest = tiebreak(sum_of_distances)[:size]
-            closest_mask = np.zeros(n, dtype = int)
-            closest_mask[closest] = 1
-            score = group_inefficiency(cst_array, winner_indices, closest_mask, bloc_label=1)
+            closest = tiebreak_smallest(sum_of_distances, size)
+            if size == n:
+                closest_mask = None
+            else:
+                closest_mask = np.zeros(n, dtype = bool)
+                closest_mask[closest] = True
+            score = _group_inefficiency_core(
+                cst_array, 
+                winner_indices, 
+                closest_mask, 
+                int(size / n * k)
+            )
             
             if np.isclose(score,heuristic_score, atol = 1e-8):
                 # If scores are close enough that differences can be chalked up to numerical error,
@@ -25,9 +25,10 @@ class Spatial:
         candidate_dist_fn_params: (dict[str, Any], optional): Parameters to be passed
             to candidate_dist_fn, defaults to None, which creates the unif(0,1)
             distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
 
     Attributes:
         voter_dist_fn (Callable[..., np.ndarray], optional): Distribution to sample a single
@@ -40,9 +41,10 @@ class Spatial:
         candidate_dist_fn_params: (dict[str, Any], optional): Parameters to be passed
             to candidate_dist_fn, defaults to None, which creates the unif(0,1)
             distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
     """
 
     def __init__(
@@ -51,7 +53,7 @@ class Spatial:
         voter_dist_fn_params: Dict[str, Any] = None,
         candidate_dist_fn: Callable = np.random.uniform,
         candidate_dist_fn_params: Dict[str, Any] = None,
-        distance_fn: Callable =euclidean_distance,
+        distance_fn: Union[Callable, str] = euclidean_distance,
     ):
 
         self.voter_dist_fn = voter_dist_fn
@@ -90,8 +92,8 @@ class Spatial:
         try:
             v = self.voter_dist_fn(**self.voter_dist_fn_params)
             c = self.candidate_dist_fn(**self.candidate_dist_fn_params)
-            distance_fn(v, c)
-        except TypeError:
+            cost_array(np.atleast_2d(v), np.atleast_2d(c), distance_fn)
+        except (TypeError, ValueError):
             raise ValueError(
                 "Distance function is invalid or incompatible "
                 "with voter/candidate distributions."
@@ -171,9 +173,10 @@ class GroupSpatial:
         candidate_dist_fn_params (list[dict[str, Any]], optional): Parameters to be passed
             to candidate_dist_fn, defaults to None, which creates the unif(0,1)
             distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
 
     Attributes:
         n_voter_groups (int): Number of voter groups.
@@ -188,9 +191,10 @@ class GroupSpatial:
         candidate_dist_fn_params: (Optional[Dict[str, Any]], optional): Parameters to be passed
             to candidate_dist_fn, defaults to None, which creates the unif(0,1)
             distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
     """
 
     def __init__(
@@ -201,7 +205,7 @@ class GroupSpatial:
         voter_dist_fn_params: List[Dict[str, Any]] = None,
         candidate_dist_fns: List[Callable] = None,
         candidate_dist_fn_params: List[Dict[str, Any]] =None,
-        distance_fn: Callable =euclidean_distance,
+        distance_fn: Union[Callable, str] = euclidean_distance,
     ):
 
         self.n_voter_groups = n_voter_groups
@@ -296,9 +300,9 @@ class GroupSpatial:
                 for j in range(self.n_candidate_groups):
                     v = self.voter_dist_fns[i](**self.voter_dist_fn_params[i])
                     c = self.candidate_dist_fns[j](**self.candidate_dist_fn_params[j])
-                    distance_fn(v, c)
+                    cost_array(np.atleast_2d(v), np.atleast_2d(c), distance_fn)
 
-        except TypeError:
+        except (TypeError, ValueError):
             raise ValueError(
                 "Distance function is invalid or incompatible "
                 "with voter/candidate distributions."
@@ -412,9 +416,10 @@ class ProbabilisticGroupSpatial(GroupSpatial):
         candidate_dist_fn_params (list[dict[str, Any]], optional): Parameters to be passed
             to candidate_dist_fn, defaults to None, which creates the unif(0,1)
             distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
 
     Attributes:
         n_voter_groups (int): Number of voter groups.
@@ -429,9 +434,10 @@ class ProbabilisticGroupSpatial(GroupSpatial):
         candidate_dist_fn_params: (Optional[Dict[str, Any]], optional): Parameters to be passed
             to candidate_dist_fn, defaults to None, which creates the unif(0,1)
             distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
     """
 
     def __init__(
@@ -442,7 +448,7 @@ class ProbabilisticGroupSpatial(GroupSpatial):
         voter_dist_fn_params: List[Dict[str, Any]] = None,
         candidate_dist_fns: List[Callable] = None,
         candidate_dist_fn_params: List[Dict[str, Any]] =None,
-        distance_fn: Callable =euclidean_distance,
+        distance_fn: Union[Callable, str] = euclidean_distance,
     ):
     
         super().__init__(
@@ -534,9 +540,10 @@ class RankedSpatial:
         voter_dist_fn_params: (dict[str, Any], optional): Parameters to be passed to
             voter_dist_fn, defaults to None,
             which creates the unif(0,1) distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
 
     Attributes:
         voter_dist_fn (Callable[..., np.ndarray], optional): Distribution to sample a single
@@ -544,15 +551,16 @@ class RankedSpatial:
         voter_dist_fn_params: (dict[str, Any], optional): Parameters to be passed to
             voter_dist_fn, defaults to None, 
             which creates the unif(0,1) distribution in 2 dimensions.
-        distance_fn: (Callable[[np.ndarray, np.ndarray], float]], optional):
+        distance_fn: (Callable[[np.ndarray, np.ndarray], float]] OR str, optional):
             Computes distance between a voter and a candidate,
-            defaults to euclidean distance.
+            defaults to euclidean distance. May also be the name of a metric 
+            supported by scipy.spatial.distance.cdist() (see cost_array()).
     """
     def __init__(
         self,
         voter_dist_fn: Callable = np.random.uniform,
         voter_dist_fn_params: Dict[str, Any] = None,
-        distance_fn: Callable =euclidean_distance
+        distance_fn: Union[Callable, str] = euclidean_distance
     ):
         
         self.voter_dist_fn = voter_dist_fn
@@ -575,8 +583,8 @@ class RankedSpatial:
         try:
             v = self.voter_dist_fn(**self.voter_dist_fn_params)
             c = self.voter_dist_fn(**self.voter_dist_fn_params)
-            distance_fn(v, c)
-        except TypeError:
+            cost_array(np.atleast_2d(v), np.atleast_2d(c), distance_fn)
+        except (TypeError, ValueError):
             raise ValueError(
                 "Distance function is invalid or incompatible "
                 "with voter/candidate distributions."
@@ -16,6 +16,30 @@ def euclidean_distance(x, y):
     return np.linalg.norm(x - y, ord=2)
 
 
+def manhattan_distance(x, y):
+    """Manhattan (L1) Distance between points x and y
+    Args:
+        x (np.ndarray): point in euclidean space
+        y (np.ndarray): point in euclidean space
+
+    Returns:
+        (float): computed distance
+    """
+    return np.linalg.norm(x - y, ord=1)
+
+
+def chebyshev_distance(x, y):
+    """Chebyshev (L-infinity) Distance between points x and y
+    Args:
+        x (np.ndarray): point in euclidean space
+        y (np.ndarray): point in euclidean space
+
+    Returns:
+        (float): computed distance
+    """
+    return np.linalg.norm(x - y, ord=np.inf)
+
+
 def tiebreak(scores : NDArray, proxy : NDArray = None) -> NDArray:
     """
     Breaks ties in a length m array of scores by:
@@ -38,6 +62,33 @@ def tiebreak(scores : NDArray, proxy : NDArray = None) -> NDArray:
         return np.lexsort((random_tiebreakers, scores))
 
 
+def tiebreak_smallest(scores : NDArray, size : int) -> NDArray:
+    """
+    Finds the indices of the size smallest values in a length m array of scores,
+    breaking ties randomly. For the same random state, this selects the same set
+    of indices as tiebreak(scores)[:size], but only the tied scores are sorted.
+    
+    Args:
+        scores (np.ndarray): Length m array of scores.
+        size (int): Number of indices to select.
+            
+    Returns:
+        (np.ndarray): Length size array of selected indices, in increasing order.
+    """
+    m = len(scores)
+    random_tiebreakers = np.random.rand(m)
+    if size >= m:
+        return np.arange(m)
+    if size <= 0:
+        return np.array([], dtype = int)
+    
+    threshold = np.partition(scores, size - 1)[size - 1]
+    below = np.flatnonzero(scores < threshold)
+    ties = np.flatnonzero(scores == threshold)
+    ties = ties[np.argsort(random_tiebreakers[ties])[:size - len(below)]]
+    return np.sort(np.concatenate((below, ties)))
+
+
 def cost_array_to_ranking(cst_array: NDArray) -> NDArray:
     """
     Given a cost array, returns a ranking of candidates for each voter.
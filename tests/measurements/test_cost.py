@@ -20,6 +20,30 @@ def test_cost_array():
     ]))
     
     
+def test_cost_array_metric_name():
+    voter_positions = np.random.normal(size = (50, 3))
+    candidate_positions = np.random.uniform(size = (7, 3))
+    manhattan = lambda x, y: np.sum(np.abs(x - y))
+    
+    cst_array1 = cost_array(voter_positions, candidate_positions, 'cityblock')
+    cst_array2 = cost_array(voter_positions, candidate_positions, manhattan)
+    assert cst_array1.shape == (7, 50)
+    assert np.allclose(cst_array1, cst_array2)
+    
+    
+def test_cost_array_registered_metrics():
+    voter_positions = np.random.normal(size = (50, 3))
+    candidate_positions = np.random.uniform(size = (7, 3))
+    
+    for distance_fn in [euclidean_distance, manhattan_distance, chebyshev_distance]:
+        cst_array1 = cost_array(voter_positions, candidate_positions, distance_fn)
+        cst_array2 = cost_array(
+            voter_positions,
+            candidate_positions,
+            lambda x, y: distance_fn(x, y)
+        )
+        assert np.allclose(cst_array1, cst_array2)
+    
     
 def test_euclidean_cost_array():
     voter_positions = np.zeros((4, 2))
@@ -48,10 +72,35 @@ def test_random_cost_array():
 
         cst_array1 = cost_array(voter_positions, candidate_positions)
         cst_array2 = euclidean_cost_array(voter_positions, candidate_positions)
+        cst_array3 = cost_array(
+            voter_positions,
+            candidate_positions,
+            lambda x, y: np.linalg.norm(x - y)
+        )
         
         assert cst_array1.shape == (43,100)
         assert cst_array2.shape == (43,100)     
         assert np.allclose(cst_array1, cst_array2)
+        assert np.allclose(cst_array2, cst_array3)
+        
+        
+def test_high_dimensional_cost_array():
+    samples = 10
+    for _ in range(samples):
+        voter_positions = np.random.normal(size = (100, 128))
+        candidate_positions = np.random.uniform(size = (43, 128))
+
+        cst_array1 = cost_array(voter_positions, candidate_positions)
+        cst_array2 = euclidean_cost_array(voter_positions, candidate_positions)
+        
+        assert cst_array2.shape == (43,100)
+        assert np.allclose(cst_array1, cst_array2)
+        
+    voter_positions = np.ones((5, 128))
+    candidate_positions = np.ones((3, 128))
+    cst_array = euclidean_cost_array(voter_positions, candidate_positions)
+    assert np.all(cst_array >= 0)
+    assert np.allclose(cst_array, 0)
         
         
 def test_min_assignment():
@@ -97,6 +146,22 @@ def test_min_assignment_cost():
     assert min_assignment_cost(cst_array, 5) == 178
     
     
+def test_min_assignment_cost_optimal_winners():
+    for _ in range(50):
+        voter_positions = np.random.normal(size = (100, 2))
+        candidate_positions = np.random.uniform(size = (20, 2))
+        cst_array = euclidean_cost_array(voter_positions, candidate_positions)
+        
+        # The best 4 candidates, in shuffled order, selected in full.
+        winners = np.random.permutation(np.argsort(np.sum(cst_array, axis = 1))[:4])
+        assert min_assignment_cost(cst_array[winners, :], 4) == min_assignment_cost(cst_array, 4)
+        
+        labels = np.zeros(100)
+        winner_cost = proportional_assignment_cost(cst_array[winners, :], labels, 0, 4)
+        optimal_cost = proportional_assignment_cost(cst_array, labels, 0, 4)
+        assert winner_cost / optimal_cost == 1
+    
+    
 
 def test_q_costs():
     cst_array = np.array([
@@ -114,6 +114,47 @@ def test_group_inefficiency():
     
     
     
+def test_small_and_full_blocs():
+    voter_positions = np.random.normal(size = (100, 2))
+    candidate_positions = np.random.uniform(size = (20, 2))
+    cst_array = euclidean_cost_array(voter_positions, candidate_positions)
+    winners = np.random.choice(20, 4, replace = False)
+    
+    # A bloc too small to deserve a representative is perfectly represented.
+    labels = np.zeros(100)
+    labels[:10] = 1
+    assert group_inefficiency(cst_array, winners, labels, bloc_label = 1) == 1
+    
+    # Selecting every voter matches the explicit computation.
+    overall_labels = np.zeros(100)
+    candidate_csts = np.sum(cst_array, axis = 1)
+    est = np.sum(np.sort(candidate_csts[winners])) / np.sum(np.sort(candidate_csts)[:4])
+    overall_ineff = group_inefficiency(cst_array, winners, overall_labels, bloc_label = 0)
+    assert np.isclose(overall_ineff, est)
+    
+    
+def test_optimal_winners():
+    for _ in range(50):
+        voter_positions = np.random.normal(size = (100, 2))
+        candidate_positions = np.random.uniform(size = (20, 2))
+        cst_array = euclidean_cost_array(voter_positions, candidate_positions)
+        
+        # The best 4 candidates for the whole electorate, in shuffled order.
+        winners = np.random.permutation(np.argsort(np.sum(cst_array, axis = 1))[:4])
+        overall_labels = np.zeros(100)
+        assert group_inefficiency(cst_array, winners, overall_labels, bloc_label = 0) == 1
+        
+        # The best 2 candidates for a bloc deserving 2 of 4 representatives.
+        labels = np.zeros(100)
+        labels[:50] = 1
+        bloc_winners = np.argsort(np.sum(cst_array[:, :50], axis = 1))[:2]
+        others = np.setdiff1d(np.arange(20), bloc_winners)
+        winners = np.random.permutation(
+            np.concatenate([bloc_winners, np.random.choice(others, 2, replace = False)])
+        )
+        assert group_inefficiency(cst_array, winners, labels, bloc_label = 1) == 1
+    
+    
 def test_with_random_cost_array():
     samples = 100
     for _ in range(samples):
@@ -127,6 +168,29 @@ def test_with_random_cost_array():
         assert overall_ineff >= 1.0
         
 
+def test_greedy_bloc_weights():
+    cst_array = np.array([
+        [0,2,0,4],
+        [5,6,7,8],
+        [0,10,0,12],
+        [9,10,11,12],
+        [13,14,15,16]
+    ])
+    weights = greedy_bloc_weights(cst_array, [0,2], t = 1)
+    assert np.allclose(weights, [0, 0.5, 0, 0.5])
+    
+    cst_array = np.array([
+        [1,2,3,4],
+        [5,6,7,8],
+        [9,10,11,12],
+        [9,10,11,12],
+        [13,14,15,16]
+    ])
+    weights = greedy_bloc_weights(cst_array, [3,4], t = 2)
+    scores = np.array([22/6, 24/8, 26/10, 28/12])
+    assert np.allclose(weights, scores / np.sum(scores))
+        
+
 def test_random_group_ineff():
     cst_array = np.array([
         [0,2,0,4],
@@ -179,6 +243,28 @@ def test_random_group_ineff():
         
     
         
+
+def test_random_group_ineff_batch():
+    voter_positions = np.random.normal(size = (100, 2))
+    candidate_positions = np.random.uniform(size = (20, 2))
+    cst_array = euclidean_cost_array(voter_positions, candidate_positions)
+    winners = np.random.choice(20, 4, replace = False)
+    
+    for t in range(1, 5):
+        seed = np.random.randint(1000)
+        np.random.seed(seed)
+        scores, bloc_masks = random_group_inefficiency_batch(cst_array, winners, 50, t = t)
+        assert scores.shape == (50,)
+        assert bloc_masks.shape == (50, 100)
+        
+        # Same draws as repeated calls to random_group_inefficiency()
+        np.random.seed(seed)
+        for r in range(50):
+            score, bloc = random_group_inefficiency(cst_array, winners, t = t)
+            assert set(np.where(bloc_masks[r])[0]) == set(bloc)
+            assert np.isclose(scores[r], score)
+            
+        
 def test_heuristic_bloc():
     candidate_positions = np.array(
         [[0,4]] * 4 +
@@ -43,6 +43,38 @@ def test_initialization():
     ):
         Spatial(voter_dist, voter_dist_params, cand_dist, cand_dist_params, distance_fn = distance)
         
+    with pytest.raises(
+        ValueError,
+        match=("Distance function is invalid or incompatible "
+                "with voter/candidate distributions.")
+    ):
+        Spatial(voter_dist, voter_dist_params, cand_dist, cand_dist_params, distance_fn = 'foo')
+        
+        
+def test_generate_metric_name():
+    voter_dist = np.random.normal
+    voter_dist_params = {"loc": 0, "scale": 1, "size":2}
+    cand_dist = np.random.uniform
+    cand_dist_params = {"low": 0, "high": 1, "size":2}
+    
+    generator = Spatial(
+        voter_dist, 
+        voter_dist_params, 
+        cand_dist, 
+        cand_dist_params, 
+        distance_fn = 'cityblock'
+    )
+    
+    (profile, 
+    candidate_pos,
+    voter_pos, 
+    candidate_labels,
+    voter_labels) = generator.generate(100, 10)
+    
+    manhattan = lambda x, y: np.sum(np.abs(x - y))
+    for j in range(100):
+        dists = [manhattan(voter_pos[j], candidate_pos[i]) for i in profile[:, j]]
+        assert np.all(np.diff(dists) >= 0)
         
 
 def test_generate():
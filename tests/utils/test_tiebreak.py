@@ -1,5 +1,5 @@
 import numpy as np
-from metric_voting.utils import tiebreak
+from metric_voting.utils import tiebreak, tiebreak_smallest
 
 def test_tiebreak():
     # Test proxy tiebreak
@@ -27,4 +27,32 @@ def test_tiebreak():
     
     assert len(counts_with_proxy) == 2
     assert np.allclose(counts_with_proxy[0]/samples, 1/2, atol = 0.05, rtol = 0)
-    assert np.allclose(counts_with_proxy[1]/samples, 1/2, atol = 0.05, rtol = 0)
\ No newline at end of file
+    assert np.allclose(counts_with_proxy[1]/samples, 1/2, atol = 0.05, rtol = 0)
+
+
+def test_tiebreak_smallest():
+    scores = np.array([3, 1, 2, 2, 2, 0])
+    assert np.array_equal(tiebreak_smallest(scores, 0), [])
+    assert np.array_equal(tiebreak_smallest(scores, 2), [1, 5])
+    assert np.array_equal(tiebreak_smallest(scores, 6), [0, 1, 2, 3, 4, 5])
+    
+    # Same selection as tiebreak() for the same random state
+    for _ in range(100):
+        scores = np.random.randint(0, 5, size = 20)
+        size = np.random.randint(0, 21)
+        state = np.random.get_state()
+        expected = set(tiebreak(scores)[:size])
+        np.random.set_state(state)
+        assert set(tiebreak_smallest(scores, size)) == expected
+    
+    # Random tiebreak
+    scores = np.array([1, 1, 1, 2, 2])
+    samples = 1000
+    third = np.zeros(samples)
+    for i in range(samples):
+        selected = tiebreak_smallest(scores, 2)
+        third[i] = list(set(range(3)) - set(selected))[0]
+        
+    _, counts = np.unique(third, return_counts=True)
+    assert len(counts) == 3
+    assert np.allclose(counts/samples, 1/3, atol = 0.05, rtol = 0)
@@ -14,6 +14,20 @@ def test_euclidean_distance():
     assert euclidean_distance(x, y) == 0
     
     
+def test_manhattan_distance():
+    x = np.array([1, 2, 3])
+    y = np.array([4, 6, 3])
+    assert manhattan_distance(x, y) == 7
+    assert manhattan_distance(x, x) == 0
+    
+    
+def test_chebyshev_distance():
+    x = np.array([1, 2, 3])
+    y = np.array([4, 6, 3])
+    assert chebyshev_distance(x, y) == 4
+    assert chebyshev_distance(x, x) == 0
+    
+    
 def test_tiebreak():
     # Test proxy tiebreak
     scores = np.array([1, 1, 1, 1, 1])